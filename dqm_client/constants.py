@@ -17,7 +17,7 @@ _temp_symbol = [
 _temp_z = list(range(0, 108))
 
 _temp_mass = [
-    0., 1.00782503207, 4.00260325415, 7.016004548, 9.012182201, 11.009305406, 12, 14.00307400478,
+    0., 1.00782503207, 4.00260325415, 7.016004548, 9.012182201, 11.009305406, 12., 14.00307400478,
     15.99491461956, 18.998403224, 19.99244017542, 22.98976928087, 23.985041699, 26.981538627,
     27.97692653246, 30.973761629, 31.972070999, 34.968852682, 39.96238312251, 38.963706679,
     39.962590983, 44.955911909, 47.947946281, 50.943959507, 51.940507472, 54.938045141,
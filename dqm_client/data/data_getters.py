@@ -2,7 +2,6 @@
 Assists in grabbing the requisite data
 """
 
-import copy
 import json
 import glob
 import os
@@ -28,7 +27,7 @@ def list_directories():
     """
     List all known directories.
     """
-    return copy.deepcopy(_data_folders.keys())
+    return list(_data_folders)
 
 
 def get_file_name(folder, filename=None):
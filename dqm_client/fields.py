@@ -31,13 +31,12 @@ def get_hash(data, field_type):
     elif field_type == "pages":
         field_type = "page"
 
-    m = hashlib.sha1()
-    concat = ""
     if field_type is None:
         return hash(str(data))
 
+    # Stream each field into the hash rather than building one large string
+    m = hashlib.sha1()
     for field in hash_fields[field_type]:
-        concat += json.dumps(data[field])
-    m.update(concat.encode("utf-8"))
+        m.update(json.dumps(data[field]).encode("utf-8"))
     sha1 = m.hexdigest()
     return sha1
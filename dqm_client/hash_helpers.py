@@ -10,7 +10,7 @@ def float_prep(array, around):
     Rounds floats to a common value and build positive zero's to prevent hash conflicts.
     """
 
-    if isinstance(array, (list, np.ndarray)):
+    if isinstance(array, (list, tuple, np.ndarray)):
         # Round array
         array = np.around(array, around)
         # Flip zeros
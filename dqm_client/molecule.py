@@ -3,10 +3,8 @@ DQM Molecule object and helpers
 """
 
 import numpy as np
-import itertools as it
 import re
 import os
-import math
 import hashlib
 import json
 
@@ -20,6 +18,16 @@ GEOMETRY_NOISE = 8
 MASS_NOISE = 6
 CHARGE_NOISE = 4
 
+# Assigning any of these attributes invalidates the cached hash
+_HASH_DIRTYING = frozenset(fields.hash_fields["molecule"])
+
+# Psi4 molecule string parsing expressions
+_RE_BOHR = re.compile(r'^\s*units?[\s=]+(bohr|au|a.u.)\s*$', re.IGNORECASE)
+_RE_ANG = re.compile(r'^\s*units?[\s=]+(ang|angstrom)\s*$', re.IGNORECASE)
+_RE_ATOM = re.compile(
+    r'^(?:(?P<gh1>@)|(?P<gh2>Gh\())?(?P<label>(?P<symbol>[A-Z]{1,3})(?:(_\w+)|(\d+))?)(?(gh2)\))(?:@(?P<mass>\d+\.\d+))?$',
+    re.IGNORECASE)
+
 
 class Molecule:
     """
@@ -32,10 +40,12 @@ class Molecule:
         """
 
         # Layout all known attributes
-        self._symbols = []
+        self._hash_cache = None
+        self._symbols = ()
         self._geometry = None
 
-        self._masses = []
+        self._masses = ()
+        self._np_mass = None
         self.name = kwargs.pop("name", "")
         self.comment = ""
         self.charge = 0.0
@@ -78,13 +88,19 @@ class Molecule:
 
 ### Any needed setters and getters
 
+    def __setattr__(self, name, value):
+        if name in _HASH_DIRTYING:
+            object.__setattr__(self, "_hash_cache", None)
+        object.__setattr__(self, name, value)
+
     @property
     def symbols(self):
         return self._symbols
 
     @symbols.setter
     def symbols(self, value):
-        self._symbols = value
+        self._symbols = tuple(value)
+        self._np_mass = None
 
     @property
     def geometry(self):
@@ -92,7 +108,44 @@ class Molecule:
 
     @geometry.setter
     def geometry(self, value):
-        self._geometry = np.array(value).reshape(-1, 3)
+        # Hashed data is stored read-only so the cached hash cannot go stale
+        geometry = np.array(value, dtype=np.float64).reshape(-1, 3)
+        geometry.setflags(write=False)
+        self._geometry = geometry
+
+    @property
+    def real(self):
+        return self._real
+
+    @real.setter
+    def real(self, value):
+        real = np.array(value, dtype=bool)
+        real.setflags(write=False)
+        self._real = real
+
+    @property
+    def fragments(self):
+        return self._fragments
+
+    @fragments.setter
+    def fragments(self, value):
+        self._fragments = tuple(tuple(frag) for frag in value)
+
+    @property
+    def fragment_charges(self):
+        return self._fragment_charges
+
+    @fragment_charges.setter
+    def fragment_charges(self, value):
+        self._fragment_charges = tuple(value)
+
+    @property
+    def fragment_multiplicities(self):
+        return self._fragment_multiplicities
+
+    @fragment_multiplicities.setter
+    def fragment_multiplicities(self, value):
+        self._fragment_multiplicities = tuple(value)
 
     @property
     def masses(self):
@@ -101,7 +154,22 @@ class Molecule:
     @masses.setter
     def masses(self, value):
         self._custom_masses = True
-        self._masses = value
+        self._masses = tuple(value)
+        self._np_mass = None
+
+    def _get_np_mass(self):
+        """
+        Returns the atomic masses as a NumPy array, cached until the symbols or masses are reassigned.
+        Both are stored as tuples, so they cannot change in place.
+        """
+        if self._np_mass is None:
+            if self._custom_masses is False:
+                self._np_mass = np.fromiter(
+                    (constants.el2masses[x] for x in self.symbols), dtype=np.float64, count=len(self.symbols))
+            else:
+                self._np_mass = np.array(self.masses, dtype=np.float64)
+
+        return self._np_mass
 
 ### Classmethods
 
@@ -127,10 +195,14 @@ class Molecule:
             with open(filename, "r") as infile:
                 data = infile.read()
         elif dtype == "numpy":
-            data = numpy.fromfile(filename)
+            # Map .npy files lazily, only the coordinate block is read into memory
+            if ext == ".npy":
+                data = np.load(filename, mmap_mode="r")
+            else:
+                data = np.fromfile(filename).reshape(-1, 4)
         elif dtype == "json":
             with open(filename, "r") as infile:
-                data = json.loads(infile)
+                data = json.load(infile)
         else:
             raise KeyError("Dtype not understood '%s'." % dtype)
 
@@ -157,7 +229,7 @@ class Molecule:
         Angstroms.
         """
 
-        arr = np.array(arr)
+        arr = np.asarray(arr, dtype=np.float64)
 
         if arr.shape[1] != 4:
             raise AttributeError("Molecule: Molecule should be shape (N, 4) not %d." % arr.shape[1])
@@ -169,19 +241,23 @@ class Molecule:
         else:
             raise KeyError("Unit '%s' not understood" % units)
 
-        self.geometry = arr[:, 1:].copy() * const
-        self.real = [True for x in arr[:, 0]]
-        self.symbols = [constants.z2el[x] for x in arr[:, 0]]
+        natom = arr.shape[0]
+        geometry = np.empty((natom, 3), dtype=np.float64)
+        np.multiply(arr[:, 1:], const, out=geometry)
+
+        self.geometry = geometry
+        self.real = np.ones(natom, dtype=bool)
+        self.symbols = [constants.z2el[x] for x in arr[:, 0].tolist()]
 
-        if len(frags) and (frags[-1] != arr.shape[0]):
-            frags.append(arr.shape[0])
+        # Fragment end points, the last fragment always runs to the final atom
+        ends = list(frags)
+        if (len(ends) == 0) or (ends[-1] != natom):
+            ends.append(natom)
+        starts = [0] + ends[:-1]
 
-        start = 0
-        for fsplit in frags:
-            self.fragments.append(list(range(start, fsplit)))
-            self.fragment_charges.append(0.0)
-            self.fragment_multiplicities.append(1)
-            start = fsplit
+        self.fragments = [range(start, end) for start, end in zip(starts, ends)]
+        self.fragment_charges = [0.0] * len(ends)
+        self.fragment_multiplicities = [1] * len(ends)
 
     def _molecule_from_string_psi4(self, text):
         """Given a string *text* of psi4-style geometry specification
@@ -190,112 +266,81 @@ class Molecule:
 
         """
 
-        # Setup re expressions
-        comment = re.compile(r'^\s*#')
-        blank = re.compile(r'^\s*$')
-        bohr = re.compile(r'^\s*units?[\s=]+(bohr|au|a.u.)\s*$', re.IGNORECASE)
-        ang = re.compile(r'^\s*units?[\s=]+(ang|angstrom)\s*$', re.IGNORECASE)
-        atom = re.compile(
-            r'^(?:(?P<gh1>@)|(?P<gh2>Gh\())?(?P<label>(?P<symbol>[A-Z]{1,3})(?:(_\w+)|(\d+))?)(?(gh2)\))(?:@(?P<mass>\d+\.\d+))?$',
-            re.IGNORECASE)
-        cgmp = re.compile(r'^\s*(-?\d+)\s+(\d+)\s*$')
-        frag = re.compile(r'^\s*--\s*$')
-        ghost = re.compile(r'@(.*)|Gh\((.*)\)', re.IGNORECASE)
-        realNumber = re.compile(r"""[-+]?(?:(?:\d*\.\d+)|(?:\d+\.?))(?:[Ee][+-]?\d+)?""", re.VERBOSE)
+        lines = text.split("\n")
+
+        # Each atom sits on its own line, so the line count bounds the number of atoms
+        geometry = np.empty((len(lines), 3), dtype=np.float64)
 
-        lines = re.split('\n', text)
-        glines = []
         ifrag = 0
+        iatom = 0
+        tempfrag = []
+        symbols = []
+        custom_masses = {}
+        fragments = []
+        fragment_charges = []
+        fragment_multiplicities = []
 
         # Assume angstrom, we want bohr
         unit_conversion = 1 / constants.physconst["bohr2angstroms"]
 
         for line in lines:
+            sline = line.strip()
 
             # handle comments
-            if comment.match(line) or blank.match(line):
-                pass
+            if (not sline) or (sline[0] == "#"):
+                continue
 
-            # handle units
-            elif bohr.match(line):
-                unit_conversion = 1.0
+            # handle fragment markers and default fragment cgmp
+            if sline == "--":
+                if len(fragment_charges) <= ifrag:
+                    fragment_charges.append(0.0)
+                    fragment_multiplicities.append(1)
+                ifrag += 1
+                fragments.append(range(tempfrag[0], tempfrag[-1] + 1))
+                tempfrag = []
+                continue
+
+            lower = sline.lower()
+            entries = sline.split()
 
-            elif ang.match(line):
-                pass
+            # handle units
+            if lower.startswith("unit"):
+                if _RE_BOHR.match(sline):
+                    unit_conversion = 1.0
+                elif not _RE_ANG.match(sline):
+                    raise TypeError(
+                        'Molecule:create_molecule_from_string: Unidentifiable line in geometry specification: %s' %
+                        line)
 
             # Handle com
-            elif line.lower().strip() in ["no_com", "nocom"]:
+            elif lower in ["no_com", "nocom"]:
                 self._fix_com = True
 
             # handle orient
-            elif line.lower().strip() in ["no_reorient", "noreorient"]:
+            elif lower in ["no_reorient", "noreorient"]:
                 self._fix_orientation = True
 
             # handle charge and multiplicity
-            elif cgmp.match(line):
-                tempCharge = int(cgmp.match(line).group(1))
-                tempMultiplicity = int(cgmp.match(line).group(2))
+            elif (len(entries) == 2) and entries[0].lstrip("-").isdecimal() and entries[1].isdecimal() and \
+                    (entries[0].count("-") < 2):
+                tempCharge = float(entries[0])
+                tempMultiplicity = int(entries[1])
 
                 if ifrag == 0:
-                    self.charge = float(tempCharge)
+                    self.charge = tempCharge
                     self.multiplicity = tempMultiplicity
-                self.fragment_charges.append(float(tempCharge))
-                self.fragment_multiplicities.append(tempMultiplicity)
-
-            # handle fragment markers and default fragment cgmp
-            elif frag.match(line):
-                try:
-                    self.fragment_charges[ifrag]
-                except:
-                    self.fragment_charges.append(0.0)
-                    self.fragment_multiplicities.append(1)
-                ifrag += 1
-                glines.append(line)
-
-            elif atom.match(line.split()[0].strip()):
-                glines.append(line)
-            else:
-                raise TypeError(
-                    'Molecule:create_molecule_from_string: Unidentifiable line in geometry specification: %s' % line)
-
-        # catch last default fragment cgmp
-        try:
-            self.fragment_charges[ifrag]
-        except:
-            self.fragment_charges.append(0.0)
-            self.fragment_multiplicities.append(1)
-
-        # Now go through the rest of the lines looking for fragment markers
-        ifrag = 0
-        iatom = 0
-        tempfrag = []
-        atomSym = ""
-        atomLabel = ""
-        geometry = []
-        tmpMass = []
-        symbols = []
-        custom_mass = False
-
-        # handle number values
-
-        for line in glines:
-
-            # handle fragment markers
-            if frag.match(line):
-                ifrag += 1
-                self.fragments.append(list(range(tempfrag[0], tempfrag[-1] + 1)))
-                self.real.extend([True for x in range(tempfrag[0], tempfrag[-1] + 1)])
-                tempfrag = []
+                fragment_charges.append(tempCharge)
+                fragment_multiplicities.append(tempMultiplicity)
 
             # handle atom markers
             else:
-                entries = re.split(r'\s+|\s*,\s*', line.strip())
-                atomm = atom.match(line.split()[0].strip().upper())
-                atomLabel = atomm.group('label')
-                atomSym = atomm.group('symbol')
+                atomm = _RE_ATOM.match(entries[0].upper())
+                if atomm is None:
+                    raise TypeError(
+                        'Molecule:create_molecule_from_string: Unidentifiable line in geometry specification: %s' %
+                        line)
 
-                # We don't know whether the @C or Gh(C) notation matched. Do a quick check.
-                ghostAtom = False if (atomm.group('gh1') is None and atomm.group('gh2') is None) else True
+                atomSym, atomMass = atomm.group('symbol', 'mass')
 
                 # Check that the atom symbol is valid
                 if not atomSym in constants.el2z:
@@ -303,52 +348,49 @@ class Molecule:
                         'Molecule:create_molecule_from_string: Illegal atom symbol in geometry specification: %s' %
                         atomSym)
 
+                # Element masses are only looked up if some atom carries a custom mass
                 symbols.append(atomSym)
-                zVal = constants.el2z[atomSym]
-                if atomm.group('mass') is None:
-                    atomMass = constants.el2masses[atomSym]
-                else:
-                    custom_mass = True
-                    atomMass = float(atomm.group('mass'))
-                tmpMass.append(atomMass)
+                if atomMass is not None:
+                    custom_masses[iatom] = float(atomMass)
 
-                charge = float(zVal)
-                if ghostAtom:
-                    zVal = 0
-                    charge = 0.0
+                # Coordinates may also be comma separated
+                if "," in sline:
+                    entries = sline.replace(",", " ").split()
 
                 # handle cartesians
                 if len(entries) == 4:
                     tempfrag.append(iatom)
-                    if realNumber.match(entries[1]):
-                        xval = float(entries[1])
-                    else:
-                        raise TypeError("Molecule::create_molecule_from_string: Unidentifiable entry %s.", entries[1])
-
-                    if realNumber.match(entries[2]):
-                        yval = float(entries[2])
-                    else:
-                        raise TypeError("Molecule::create_molecule_from_string: Unidentifiable entry %s.", entries[2])
-
-                    if realNumber.match(entries[3]):
-                        zval = float(entries[3])
-                    else:
-                        raise TypeError("Molecule::create_molecule_from_string: Unidentifiable entry %s.", entries[3])
-
-                    geometry.append([xval, yval, zval])
+                    try:
+                        geometry[iatom] = entries[1:]
+                    except ValueError:
+                        raise TypeError("Molecule::create_molecule_from_string: Unidentifiable entry in %s." % line)
+
+                    # The float conversion also accepts nan and inf, which are not coordinates
+                    if not np.isfinite(geometry[iatom]).all():
+                        raise TypeError("Molecule::create_molecule_from_string: Unidentifiable entry in %s." % line)
                 else:
                     raise TypeError('Molecule::create_molecule_from_string: Illegal geometry specification line : %s. \
                         You should provide either Z-Matrix or Cartesian input' % line)
 
                 iatom += 1
 
-        if custom_mass:
-            self.masses = tmpMass
+        # catch last default fragment cgmp
+        if len(fragment_charges) <= ifrag:
+            fragment_charges.append(0.0)
+            fragment_multiplicities.append(1)
+
+        if custom_masses:
+            self.masses = [custom_masses.get(num, constants.el2masses[sym]) for num, sym in enumerate(symbols)]
 
         self.symbols = symbols
-        self.geometry = np.array(geometry) * unit_conversion
-        self.fragments.append(list(range(tempfrag[0], tempfrag[-1] + 1)))
-        self.real.extend([True for x in range(tempfrag[0], tempfrag[-1] + 1)])
+        geometry = geometry[:iatom]
+        geometry *= unit_conversion
+        self.geometry = geometry
+        fragments.append(range(tempfrag[0], tempfrag[-1] + 1))
+        self.fragments = fragments
+        self.fragment_charges = fragment_charges
+        self.fragment_multiplicities = fragment_multiplicities
+        self.real = np.ones(iatom, dtype=bool)
 
 ### Comparison and validation
 
@@ -358,7 +400,7 @@ class Molecule:
         """
 
         if data is None:
-            data = self.to_json()
+            data = self._to_json_dict()
 
         schema.validate(data, "molecule")
 
@@ -370,19 +412,29 @@ class Molecule:
         if bench is None:
             bench = self
 
-        match = True
-        match &= bench.symbols == other.symbols
+        # Cheapest checks first, bail on the first mismatch
+        if bench.symbols != other.symbols:
+            return False
         if self._custom_masses or other._custom_masses:
-            match &= np.allclose(bench.masses, other.masses, atol=MASS_NOISE)
-        match &= np.equal(bench.real, other.real).all()
-        match &= np.equal(bench.fragments, other.fragments).all()
-        match &= np.allclose(bench.fragment_charges, other.fragment_charges, atol=CHARGE_NOISE)
-        match &= np.equal(bench.fragment_multiplicities, other.fragment_multiplicities).all()
-
-        match &= np.allclose(bench.charge, other.charge, atol=CHARGE_NOISE)
-        match &= np.equal(bench.multiplicity, other.multiplicity).all()
-        match &= np.allclose(bench.geometry, other.geometry, atol=GEOMETRY_NOISE)
-        return match
+            if not np.allclose(bench.masses, other.masses, atol=MASS_NOISE):
+                return False
+        if not np.array_equal(bench.real, other.real):
+            return False
+        if bench.fragments != other.fragments:
+            return False
+        if not np.allclose(bench.fragment_charges, other.fragment_charges, atol=CHARGE_NOISE):
+            return False
+        if not np.array_equal(bench.fragment_multiplicities, other.fragment_multiplicities):
+            return False
+
+        if not np.allclose(bench.charge, other.charge, atol=CHARGE_NOISE):
+            return False
+        if not np.array_equal(bench.multiplicity, other.multiplicity):
+            return False
+        if not np.allclose(bench.geometry, other.geometry, atol=GEOMETRY_NOISE):
+            return False
+
+        return True
 
     def pretty_print(self):
         """Print the molecule in Angstroms. Same as :py:func:`print_out` only always in Angstroms.
@@ -414,24 +466,11 @@ class Molecule:
         """
         Compute the moment inertia tensor for a given geometry.
         """
-        # Build inertia tensor
-        tensor = np.zeros((3, 3))
-
-        # Diagonal
-        tensor[0][0] = np.sum(weight * (geom[:, 1]**2.0 + geom[:, 2]**2.0))
-        tensor[1][1] = np.sum(weight * (geom[:, 0]**2.0 + geom[:, 2]**2.0))
-        tensor[2][2] = np.sum(weight * (geom[:, 0]**2.0 + geom[:, 1]**2.0))
+        # Weighted second moments, S(alpha, beta) = sum(w * r_alpha * r_beta)
+        moments = np.dot((geom * weight[:, None]).T, geom)
 
-        # I(alpha, beta)
-        # Off diagonal
-        tensor[0][1] = -1.0 * np.sum(weight * geom[:, 0] * geom[:, 1])
-        tensor[0][2] = -1.0 * np.sum(weight * geom[:, 0] * geom[:, 2])
-        tensor[1][2] = -1.0 * np.sum(weight * geom[:, 1] * geom[:, 2])
-
-        # Other half
-        tensor[1][0] = tensor[0][1]
-        tensor[2][0] = tensor[0][2]
-        tensor[2][1] = tensor[1][2]
+        # I(alpha, alpha) = trace(S) - S(alpha, alpha), I(alpha, beta) = -S(alpha, beta)
+        tensor = np.eye(3) * np.trace(moments) - moments
         return tensor
 
     def orient_molecule(self):
@@ -439,45 +478,33 @@ class Molecule:
         Centers the molecule and orients via inertia tensor.
         """
 
-        # Get the mass as an array
-
         # Masses are needed for orientation
-        if self._custom_masses is False:
-            np_mass = np.array([constants.el2masses[x] for x in self.symbols])
-        else:
-            np_mass = np.array(self.masses)
+        np_mass = self._get_np_mass()
 
         # Center on Mass
-        self.geometry -= np.average(self.geometry, axis=0, weights=np_mass)
+        total_mass = np_mass.sum()
+        if total_mass == 0:
+            raise ZeroDivisionError("Molecule:orient_molecule: Total mass is zero, cannot center on the mass.")
+        geom = self.geometry - np.dot(np_mass, self.geometry) / total_mass
 
         # Rotate into inertial frame
-        tensor = self._inertial_tensor(self.geometry, np_mass)
+        tensor = self._inertial_tensor(geom, np_mass)
         evals, evecs = np.linalg.eigh(tensor)
 
-        self.geometry = np.dot(self.geometry, evecs)
+        geom = np.dot(geom, evecs)
 
         # Phases? Lets do the simplest thing and ensure the first atom in each column
         # that is not on a plane is positve
 
-        phase_check = [False, False, False]
-
         geom_noise = 10**(-GEOMETRY_NOISE)
-        for num in range(self.geometry.shape[0]):
-
-            for x in range(3):
-                if phase_check[x]: continue
-
-                val = self.geometry[num, x]
+        off_plane = np.abs(geom) >= geom_noise
+        first = np.argmax(off_plane, axis=0)
 
-                if abs(val) < geom_noise: continue
+        # Columns with every atom on the plane are left alone
+        phase = np.where(off_plane.any(axis=0), np.sign(geom[first, np.arange(3)]), 1.0)
+        geom *= phase
 
-                phase_check[x] = True
-
-                if val < 0:
-                    self.geometry[:, x] *= -1
-
-            if sum(phase_check) == 3:
-                break
+        self.geometry = geom
 
     def get_fragment(self, real, ghost=None, orient=True):
         """
@@ -499,55 +526,34 @@ class Molecule:
             raise TypeError("Molecule:get_fragment: real and ghost sets are overlaping! (%s, %s)." % (str(real),
                                                                                                       str(ghost)))
 
-        geom_blocks = []
-        symbols = []
-        masses = []
-        real_atoms = []
-
-        # Loop through the real blocks
-        frag_start = 0
-        for frag in real:
-            frag_size = len(self.fragments[frag])
-            geom_blocks.append(self.geometry[self.fragments[frag]])
-
-            for idx in self.fragments[frag]:
-                symbols.append(self.symbols[idx])
-                real_atoms.append(True)
-                if self._custom_masses:
-                    masses.append(self.masses[idx])
+        # Gather all requested atoms in a single index, real fragments first
+        blocks = list(real) + list(ghost)
+        sizes = [len(self.fragments[frag]) for frag in blocks]
+        atom_idx = np.concatenate([np.asarray(self.fragments[frag], dtype=np.intp) for frag in blocks])
+        nreal = sum(sizes[:len(real)])
 
-            ret.fragments.append(list(range(frag_start, frag_start + frag_size)))
-            frag_start += frag_size
+        # Build the new fragment ranges from the block offsets
+        offsets = np.cumsum([0] + sizes).tolist()
+        ret.fragments = [range(offsets[k], offsets[k + 1]) for k in range(len(blocks))]
 
-            ret.fragment_charges.append(float(self.fragment_charges[frag]))
-            ret.fragment_multiplicities.append(self.fragment_multiplicities[frag])
+        fragment_charges = [float(self.fragment_charges[frag]) for frag in real]
+        fragment_multiplicities = [self.fragment_multiplicities[frag] for frag in real]
 
         # Set charge and multiplicity
-        ret.charge = sum(ret.fragment_charges)
-        ret.multiplicity = sum(x - 1 for x in ret.fragment_multiplicities)
-
-        # Loop through the ghost blocks
-        for frag in ghost:
-            frag_size = len(self.fragments[frag])
-            geom_blocks.append(self.geometry[self.fragments[frag]])
-
-            for idx in self.fragments[frag]:
-                symbols.append(self.symbols[idx])
-                real_atoms.append(False)
-                if self._custom_masses:
-                    masses.append(self.masses[idx])
-
-            ret.fragments.append(list(range(frag_start, frag_start + frag_size)))
-            frag_start += frag_size
-
-            ret.fragment_charges.append(self.fragment_charges[frag])
-            ret.fragment_multiplicities.append(self.fragment_multiplicities[frag])
-
-        ret.symbols = symbols
-        ret.geometry = np.vstack(geom_blocks)
-        ret.real = real_atoms
+        ret.charge = sum(fragment_charges)
+        ret.multiplicity = sum(x - 1 for x in fragment_multiplicities)
+
+        fragment_charges.extend(self.fragment_charges[frag] for frag in ghost)
+        fragment_multiplicities.extend(self.fragment_multiplicities[frag] for frag in ghost)
+        ret.fragment_charges = fragment_charges
+        ret.fragment_multiplicities = fragment_multiplicities
+
+        atom_list = atom_idx.tolist()
+        ret.symbols = [self.symbols[idx] for idx in atom_list]
+        ret.geometry = self.geometry[atom_idx]
+        ret.real = np.concatenate((np.ones(nreal, dtype=bool), np.zeros(len(atom_list) - nreal, dtype=bool)))
         if self._custom_masses:
-            ret.masses = masses
+            ret.masses = [self.masses[idx] for idx in atom_list]
 
         if orient:
             ret.orient_molecule()
@@ -568,7 +574,12 @@ class Molecule:
         fragmentation, charges and multiplicities, and any frame
         restriction.
         """
-        text = "\n"
+        text = ["\n"]
+
+        # Format labels and coordinates for every atom up front
+        atom_line = "    %-8s    % 14.10f % 14.10f % 14.10f\n"
+        labels = [sym if real else "Gh(" + sym + ")" for sym, real in zip(self.symbols, self.real)]
+        geometry = self.geometry.tolist()
 
         # append atoms and coordentries and fragment separators with charge and multiplicity
         for num, frag in enumerate(self.fragments):
@@ -577,23 +588,19 @@ class Molecule:
                 divider = ""
 
             if any(self.real[at] for at in frag):
-                text += "%s    \n    %d %d\n" % (divider, self.fragment_charges[num],
-                                                 self.fragment_multiplicities[num])
+                text.append("%s    \n    %d %d\n" % (divider, self.fragment_charges[num],
+                                                     self.fragment_multiplicities[num]))
 
-            for at in frag:
-                if self.real[at]:
-                    text += "    %-8s" % self.symbols[at]
-                else:
-                    text += "    %-8s" % ("Gh(" + self.symbols[at] + ")")
-                text += "    % 14.10f % 14.10f % 14.10f\n" % tuple(self.geometry[at])
-        text += "\n"
+            values = tuple(x for at in frag for x in (labels[at], *geometry[at]))
+            text.append(atom_line * len(frag) % values)
+        text.append("\n")
 
         # append units and any other non-default molecule keywords
-        text += "    units bohr\n"
-        text += "    no_com\n"
-        text += "    no_reorient\n"
+        text.append("    units bohr\n")
+        text.append("    no_com\n")
+        text.append("    no_reorient\n")
 
-        return text
+        return "".join(text)
 
     @classmethod
     def from_json(cls, data, orient=True):
@@ -604,45 +611,80 @@ class Molecule:
         Returns a JSON form of the Molecule object.
         """
 
+        ret = self._to_json_dict()
+        self.validate(data=ret)
+        return ret
+
+    def _to_json_dict(self):
+        """
+        Builds the JSON form of the Molecule object without validating it.
+        """
+
         np.set_printoptions(precision=16)
         ret = {}
         for field in fields.valid_fields["molecule"]:
-            data = getattr(self, field)
-
-            # Do we add this data?
-            if isinstance(data, (np.ndarray, list, tuple, dict, str)) and (len(data) == 0): continue
-
-            # If we added masses for orientation, continue
-            if (field == "masses") and (self._custom_masses is False):
+            data = self._prepared_field(field)
+            if data is None:
                 continue
 
-            if field == "geometry":
-                ret[field] = hash_helpers.float_prep(data, GEOMETRY_NOISE).ravel().tolist()
-            elif field == "fragment_charges":
-                ret[field] = hash_helpers.float_prep(data, CHARGE_NOISE).tolist()
-            elif field == "charge":
-                ret[field] = hash_helpers.float_prep(data, CHARGE_NOISE)
-            elif field == "masses":
-                ret[field] = hash_helpers.float_prep(data, MASS_NOISE).tolist()
-            else:
-                ret[field] = data
+            if isinstance(data, np.ndarray):
+                data = data.tolist()
+            elif isinstance(data, tuple):
+                data = [list(x) if isinstance(x, tuple) else x for x in data]
+            ret[field] = data
 
-        self.validate(data=ret)
         return ret
 
+    def _prepared_field(self, field):
+        """
+        Returns a field rounded for serialization, NumPy data is not converted to lists.
+        Returns None if the field is not serialized.
+        """
+        data = getattr(self, field)
+
+        # Do we add this data?
+        if isinstance(data, (np.ndarray, list, tuple, dict, str)) and (len(data) == 0):
+            return None
+
+        # If we added masses for orientation, continue
+        if (field == "masses") and (self._custom_masses is False):
+            return None
+
+        if field == "geometry":
+            return hash_helpers.float_prep(data, GEOMETRY_NOISE).ravel()
+        elif field == "fragment_charges":
+            return hash_helpers.float_prep(data, CHARGE_NOISE)
+        elif field == "charge":
+            return hash_helpers.float_prep(data, CHARGE_NOISE)
+        elif field == "masses":
+            return hash_helpers.float_prep(data, MASS_NOISE)
+        else:
+            return data
+
     def get_hash(self):
         """
         Returns the hash of the molecule.
+
+        The hash is cached until a hashed attribute is reassigned. Hashed attributes are stored as
+        tuples or read-only arrays, so they cannot be modified in place.
         """
 
+        if self._hash_cache is not None:
+            return self._hash_cache
+
         m = hashlib.sha1()
-        concat = ""
 
-        tmp_json = self.to_json()
+        # The molecule was validated on construction, only prepare the hashed fields
         for field in schema.get_hash_fields("molecule"):
-            if field not in tmp_json:
+            data = self._prepared_field(field)
+            if data is None:
                 continue
-            concat += json.dumps(tmp_json[field])
 
-        m.update(concat.encode("utf-8"))
-        return m.hexdigest()
+            if isinstance(data, np.ndarray):
+                data = data.tolist()
+
+            # SHA-1 is a streaming hash, feeding each field is identical to hashing the concatenation
+            m.update(json.dumps(data).encode("utf-8"))
+
+        self._hash_cache = m.hexdigest()
+        return self._hash_cache
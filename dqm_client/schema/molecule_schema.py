@@ -106,5 +106,5 @@ molecule_schema = {
         "symbols", "masses", "charge", "multiplicity", "real", "geometry", "fragments", "fragment_charges",
         "fragment_multiplicities"
     ],
-    "requied_definitions": ["provenance"]
+    "required_definitions": ["provenance"]
 }
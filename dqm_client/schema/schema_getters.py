@@ -15,9 +15,10 @@ from .options_schema import options_schema
 __all__ = ["get_schema", "validate", "get_hash_fields"]
 
 _schemas = {}
+_validators = {}
 
 # Add in molecule
-for req in molecule_schema["requied_definitions"]:
+for req in molecule_schema["required_definitions"]:
     molecule_schema["definitions"][req] = get_definition(req)
 
 _schemas["molecule"] = molecule_schema
@@ -35,14 +36,21 @@ def get_hash_fields(name):
 def get_schema(name):
     if name not in _schemas:
         raise KeyError("Schema name %s not found." % name)
-    return copy.deepcopy(_schemas)
+    return copy.deepcopy(_schemas[name])
+
+
+def _get_validator(schema_name):
+    # Building a validator is expensive, build each one once
+    if schema_name not in _validators:
+        _validators[schema_name] = jsonschema.Draft4Validator(_schemas[schema_name])
+    return _validators[schema_name]
 
 
 def validate(data, schema_name, return_errors=False):
     if schema_name not in _schemas:
-        raise KeyError("Schema name %s not found." % name)
+        raise KeyError("Schema name %s not found." % schema_name)
 
-    error_gen = jsonschema.Draft4Validator(_schemas[schema_name]).iter_errors(data)
+    error_gen = _get_validator(schema_name).iter_errors(data)
     errors = [x for x in error_gen]
     if len(errors):
         if return_errors:
@@ -1,10 +1,13 @@
 """
 Tets the inports and exports of the Molecule object.
 """
+import json
+
 import numpy as np
 import pytest
 
 import dqm_client as dqm
+from dqm_client import constants
 
 
 def test_molecule_constructors():
@@ -117,3 +120,153 @@ def test_molecule_errors():
     data["whatever"] = 5
     with pytest.raises(ValueError):
         dqm.schema.validate(data, "molecule")
+
+    # Massless molecules cannot be oriented
+    with pytest.raises(ZeroDivisionError):
+        dqm.Molecule("X 0 0 0\nX 0 0 1")
+
+def test_molecule_hash_cache():
+    mol = dqm.data.get_molecule("water_dimer_minima.psimol")
+    ref_hash = mol.get_hash()
+
+    # Reassigning a hashed field must invalidate the cached hash
+    mol.geometry = mol.geometry * 2
+    assert mol.get_hash() != ref_hash
+
+    mol.geometry = mol.geometry / 2
+    assert mol.get_hash() == ref_hash
+
+
+def test_molecule_hash_immutable():
+    mol = dqm.data.get_molecule("water_dimer_minima.psimol")
+    ref_hash = mol.get_hash()
+
+    # Hashed data cannot be modified in place
+    with pytest.raises(ValueError):
+        mol.geometry[0, 0] += 1
+    with pytest.raises(ValueError):
+        mol.real[0] = False
+    with pytest.raises(TypeError):
+        mol.symbols[0] = "C"
+    with pytest.raises(TypeError):
+        mol.fragments[0][0] = 5
+    with pytest.raises(TypeError):
+        mol.fragment_charges[0] = 1.0
+    with pytest.raises(TypeError):
+        mol.fragment_multiplicities[0] = 2
+
+    assert mol.get_hash() == ref_hash
+
+
+def test_molecule_custom_masses():
+    mol = dqm.Molecule("0 1\nO@16.5 0 0 0\nH 0 0 1.8\nH 0 1.5 0")
+
+    # Masses feed the orientation, they cannot be modified in place
+    with pytest.raises(TypeError):
+        mol.masses[1] = 50.0
+
+    # Reassigning the masses reorients the same as parsing them directly
+    mol.masses = (16.5, 50.0, constants.el2masses["H"])
+    mol.orient_molecule()
+    ref = dqm.Molecule("0 1\nO@16.5 0 0 0\nH@50.0 0 0 1.8\nH 0 1.5 0")
+    assert mol.compare(ref)
+    assert np.allclose(mol.geometry, ref.geometry)
+
+def test_molecule_numpy_fragments():
+    water_psi = dqm.data.get_molecule("water_dimer_minima.psimol")
+    ele = np.array([8, 1, 1, 8, 1, 1]).reshape(-1, 1)
+    npwater = np.hstack((ele, water_psi.geometry))
+
+    # Without a splitting pattern all atoms belong to a single fragment
+    mol = dqm.Molecule(npwater, dtype="numpy", units="bohr")
+    assert mol.fragments == (tuple(range(6)), )
+    assert mol.fragment_charges == (0.0, )
+
+    # The callers splitting pattern is left untouched
+    frags = [3]
+    mol = dqm.Molecule(npwater, dtype="numpy", frags=frags, units="bohr")
+    assert frags == [3]
+    assert mol.fragments == ((0, 1, 2), (3, 4, 5))
+
+
+_ang2bohr = 1 / constants.physconst["bohr2angstroms"]
+
+
+@pytest.mark.parametrize("mol_str, scale", [
+    ("He 0 0 0\nHe 0 0 1", _ang2bohr),
+    ("He 0 0 0\nHe 0 0 1\nunits angstrom", _ang2bohr),
+    ("He 0 0 0\nHe 0 0 1\nunits ang", _ang2bohr),
+    ("units bohr\nHe 0 0 0\nHe 0 0 1", 1.0),
+    ("He 0 0 0\nHe 0 0 1\nunits au", 1.0),
+    ("He 0 0 0\nHe 0 0 1\nunit = a.u.", 1.0),
+    ("He 0.0, 0.0, 0.0\nHe 0.0, 0.0, 1.0", _ang2bohr),
+])
+def test_psi4_string_units(mol_str, scale):
+    mol = dqm.Molecule(mol_str)
+
+    dist = np.linalg.norm(mol.geometry[0] - mol.geometry[1])
+    assert np.isclose(dist, scale)
+
+
+@pytest.mark.parametrize("mol_str, attrs", [
+    ("O@16.5 0 0 0\nH 0 0 1\nH 0 1 0", {
+        "symbols": ("O", "H", "H"),
+        "masses": (16.5, constants.el2masses["H"], constants.el2masses["H"])
+    }),
+    ("He 0 0 0\nGh(He) 0 0 2\n@Ne 0 0 4", {
+        "symbols": ("HE", "HE", "NE")
+    }),
+    ("-1 1\nCl 0 0 0", {
+        "charge": -1.0,
+        "multiplicity": 1,
+        "fragment_charges": (-1.0, ),
+        "fragment_multiplicities": (1, )
+    }),
+    ("0 1\nHe 0 0 0\n--\n1 2\nLi 0 0 3", {
+        "fragments": ((0, ), (1, )),
+        "fragment_charges": (0.0, 1.0),
+        "fragment_multiplicities": (1, 2)
+    }),
+])
+def test_psi4_string_parse(mol_str, attrs):
+    mol = dqm.Molecule(mol_str)
+
+    for field, value in attrs.items():
+        assert getattr(mol, field) == value
+
+
+@pytest.mark.parametrize("mol_str", [
+    "He 0 0 0\nunits furlong",
+    "He 0 0",
+    "He 0 0 x",
+    "He 0 0 nan",
+    "He 0 0 inf",
+    "Zz 0 0 0",
+    "1 He",
+])
+def test_psi4_string_errors(mol_str):
+    with pytest.raises(TypeError):
+        dqm.Molecule(mol_str)
+
+
+def test_molecule_from_file(tmp_path):
+    mol = dqm.Molecule("O 0 0 0.1173\nH 0 0.7572 -0.4692\nH 0 -0.7572 -0.4692")
+    ref_hash = mol.get_hash()
+
+    # NumPy files hold (Z, X, Y, Z) rows in Angstrom
+    ele = np.array([8, 1, 1]).reshape(-1, 1)
+    arr = np.hstack((ele, mol.geometry * constants.physconst["bohr2angstroms"]))
+
+    np.save(str(tmp_path / "water.npy"), arr)
+    assert dqm.Molecule.from_file(str(tmp_path / "water.npy")).get_hash() == ref_hash
+
+    arr.tofile(str(tmp_path / "water.bin"))
+    assert dqm.Molecule.from_file(str(tmp_path / "water.bin"), dtype="numpy").get_hash() == ref_hash
+
+    with open(str(tmp_path / "water.json"), "w") as outfile:
+        json.dump(mol.to_json(), outfile)
+    assert dqm.Molecule.from_file(str(tmp_path / "water.json")).get_hash() == ref_hash
+
+    with open(str(tmp_path / "water.psimol"), "w") as outfile:
+        outfile.write(mol.to_string())
+    assert dqm.Molecule.from_file(str(tmp_path / "water.psimol")).get_hash() == ref_hash
@@ -10,3 +10,18 @@ def test_options():
     opts = dqm.data.get_options("psi_default")
 
     dqm.schema.validate(opts, "options")
+
+def test_get_schema():
+    mol_schema = dqm.schema.get_schema("molecule")
+    assert "hash_fields" in mol_schema
+
+    # Returned schemas are copies
+    mol_schema["hash_fields"] = []
+    assert len(dqm.schema.get_schema("molecule")["hash_fields"])
+
+    with pytest.raises(KeyError):
+        dqm.schema.get_schema("not_a_schema")
+
+def test_validate_unknown_schema():
+    with pytest.raises(KeyError):
+        dqm.schema.validate({}, "not_a_schema")
@@ -1,35 +1,23 @@
 """
 dqm_client
 A front-end client to DQM
+
+All static package metadata lives in setup.cfg, this file only wires in versioneer.
 """
+import functools
+import os
+import sys
+
 import setuptools
+
+# PEP 517 builds do not put the project root on the path, versioneer.py is vendored there
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import versioneer
 
-DOCLINES = __doc__.split("\n")
+# The versioneer build commands call get_versions() again, only query git once per run
+versioneer.get_versions = functools.lru_cache(maxsize=None)(versioneer.get_versions)
 
 setuptools.setup(
-    name='dqm_client',
-    author='The Molecular Sciences Software Institute',
-    description=DOCLINES[0],
-    long_description="\n".join(DOCLINES[2:]),
     version=versioneer.get_version(),
     cmdclass=versioneer.get_cmdclass(),
-    license='BSD-3-Clause',
-    packages=setuptools.find_packages(),
-    #packages=['dqm_client', "dqm_client.tests", "dqm_client.data", "dqm_client.schema"],
-    # Optional include package data to ship with your package
-    #package_data={
-    #    'dqm_client': ["dqm_client/data/*.json"]
-    #},
-    include_package_data=True,
-    install_requires=["numpy"],
-    # Additional entries you may want simply uncomment the lines you want and fill in the data
-    # author_email='me@place.org',      # Author email
-    # url='http://www.my_package.com',  # Website
-    # platforms=['Linux',
-    #            'Mac OS-X',
-    #            'Unix',
-    #            'Windows'],            # Valid platforms your code works on, adjust to your flavor
-    zip_safe=False,                   # Compress final package or not
-    # python_requires=">=3.5",          # Python version restrictions
 )